@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
-import argparse
 import os
-import subprocess
 import sys
 import warnings
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 _DEFAULT_COLS = 130
 _DEFAULT_ROWS = 40
 
+_VERSION = "0.1.0"
+
+# Hand-written so --help never has to import argparse (or the Textual stack).
+_USAGE = f"""\
+usage: python -m automation.bibliography_manager [-h] [--version] [--path PATH] [--external]
+
+TCC Bibliography Manager — TUI for research paper tracking
+
+options:
+  -h, --help   show this help message and exit
+  --version    show program's version number and exit
+  --path PATH  Path to the bibliography JSON file (default: bibliography/data.json)
+  --external   Launch in an external terminal window ({_DEFAULT_COLS}x{_DEFAULT_ROWS})
+"""
+
 
 def _launch_external(extra_args: list[str]) -> int:
     """Re-launch the TUI in an external cmd.exe window with a fixed size."""
+    import subprocess
+
     cols = _DEFAULT_COLS
     rows = _DEFAULT_ROWS
     py = sys.executable
@@ -30,13 +49,76 @@ def _launch_external(extra_args: list[str]) -> int:
     )
 
 
-def main() -> None:
-    # Suppress harmless asyncio pipe cleanup warnings on Windows / Python 3.14+
-    warnings.filterwarnings("ignore", message="unclosed transport", category=ResourceWarning)
+def _fast_event_loop() -> asyncio.AbstractEventLoop | None:
+    """Return a winloop / uvloop event loop when one is installed, else None.
+
+    Both are optional (``pip install utilities[speedups]``); Textual falls
+    back to the stock asyncio loop when this returns None.
+    """
+    import asyncio
+    import inspect
+
+    # Textual installs asyncio.eager_task_factory, and uvloop/winloop call
+    # the task factory with eager_start=...; older factories reject it.
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        params = inspect.signature(factory).parameters
+        if "eager_start" not in params and not any(
+            p.kind is p.VAR_KEYWORD for p in params.values()
+        ):
+            return None
+    try:
+        if os.name == "nt":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return None
+    return fast_loop.new_event_loop()
+
+
+def _resize_console() -> None:
+    """Resize the Windows console to the default size, unless it already is.
+
+    ``mode.com`` is spawned directly (no extra cmd.exe layer; the ``.com``
+    must be spelled out, CreateProcess only appends ``.exe``), and only
+    when the current size differs — repeated launches in an already
+    sized console skip the spawn entirely.
+    """
+    import shutil
+
+    if tuple(shutil.get_terminal_size((0, 0))) == (_DEFAULT_COLS, _DEFAULT_ROWS):
+        return
+    import subprocess
+
+    try:
+        subprocess.run(
+            ["mode.com", "con:", f"cols={_DEFAULT_COLS}", f"lines={_DEFAULT_ROWS}"],
+            shell=False,
+            check=False,
+        )
+    except OSError:
+        pass
+
+
+def _sniff_path(argv: list[str]) -> str | None:
+    """Cheaply pull ``--path`` out of *argv* without building a parser."""
+    for i, arg in enumerate(argv):
+        if arg == "--path" and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith("--path="):
+            return arg.partition("=")[2]
+    return None
+
+
+def _parse_args(argv: list[str]) -> str | None:
+    """Full argparse validation for the normal (TUI) launch.  Returns --path."""
+    import argparse
 
     parser = argparse.ArgumentParser(
         description="TCC Bibliography Manager — TUI for research paper tracking",
     )
+    parser.add_argument("--version", action="version", version=_VERSION)
     parser.add_argument(
         "--path",
         default=None,
@@ -47,26 +129,43 @@ def main() -> None:
         action="store_true",
         help=f"Launch in an external terminal window ({_DEFAULT_COLS}x{_DEFAULT_ROWS})",
     )
-    args = parser.parse_args()
+    return parser.parse_args(argv).path
+
 
-    if args.external:
+def main() -> None:
+    argv = sys.argv[1:]
+
+    # Fast paths: answer --help / --version and hand off --external before
+    # argparse or the Textual/scraper stack is imported.
+    if argv and argv[0] in ("-h", "--help"):
+        sys.stdout.write(_USAGE)
+        raise SystemExit(0)
+    if argv and argv[0] == "--version":
+        print(_VERSION)
+        raise SystemExit(0)
+    if "--external" in argv:
         # Build arg list for the inner invocation (without --external)
-        inner_args: list[str] = []
-        if args.path:
-            inner_args += ["--path", args.path]
-        raise SystemExit(_launch_external(inner_args))
+        path = _sniff_path(argv)
+        raise SystemExit(_launch_external(["--path", path] if path else []))
+
+    # Suppress harmless asyncio pipe cleanup warnings on Windows / Python 3.14+
+    warnings.filterwarnings("ignore", message="unclosed transport", category=ResourceWarning)
+
+    path = _parse_args(argv)
 
     # Attempt to resize the current console on Windows
     if os.name == "nt":
-        try:
-            os.system(f"mode con: cols={_DEFAULT_COLS} lines={_DEFAULT_ROWS}")
-        except Exception:
-            pass
+        _resize_console()
 
     from .app import BibliographyApp
 
-    app = BibliographyApp(bib_path=args.path)
-    app.run()
+    app = BibliographyApp(bib_path=path)
+    loop = _fast_event_loop()
+    try:
+        app.run(loop=loop)
+    finally:
+        if loop is not None:
+            loop.close()
 
 
 if __name__ == "__main__":
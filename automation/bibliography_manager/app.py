@@ -6,20 +6,25 @@ Launch with:  python -m automation.bibliography_manager
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
-import platform
 import re
-import subprocess
+import time
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import unquote_plus
 
 import httpx
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.message import Message
 from textual.screen import ModalScreen
+from textual.timer import Timer
+from textual.widgets.data_table import ColumnKey
 from textual.widgets import (
     Button,
     DataTable,
@@ -33,29 +38,122 @@ from textual.widgets import (
 )
 
 from caseconverter import snakecase
-from urllib.parse import urlparse, parse_qs
 
 from .models import Article, Bibliography, Survey
 from . import storage
-from .scraper import fetch_ieee_meta, fetch_ieee_title, fetch_references
+from .watcher import BibFileWatcher
+
+# NOTE: ``.scraper`` pulls in Playwright and is only needed once the user
+# actually fetches something, so it is imported at the call sites below.
 
 # ── Constants ────────────────────────────────────────────────
 
 _FRAC_RE = re.compile(r"(\d+)/(\d+)")
+_PHASE1_FOUND_RE = re.compile(r"found (\d+)")
+_PHASE1_DOIS_RE = re.compile(r"(\d+) DOIs found inline")
+_API_REFS_RE = re.compile(r"(\d+) references")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_NAME_CHARS_RE = re.compile(r"[^\w\s-]")
+_ARNUMBER_RE = re.compile(r"(?:^|&)arnumber=([^&]+)")
 _MSG_SURVEY_NOT_FOUND = "Survey not found"
+_LOG_FLUSH_INTERVAL = 0.016  # seconds — roughly one frame at 60fps
+_LOG_FLUSH_BATCH = 32  # progress lines buffered before a forced flush
+_REFRESH_COALESCE = 0.05  # seconds — refresh requests within this window share one render
+_IMPORT_SAVE_EVERY = 10  # surveys added between checkpoint saves during a TXT import
+_PDF_DIR = Path("bibliography/pdfs")  # where PDFDownloadModal and survey PDFs land
+_PDF_CONCURRENCY = 8  # simultaneous PDF downloads in PDFDownloadModal
+_PDF_PER_HOST = 4  # ... of which at most this many against any one host
+_PDF_CHUNK_BYTES = 64 * 1024  # streaming read size for PDF downloads
+# Keep every connection the downloads open alive for reuse (no TLS
+# re-handshake per PDF); httpx's default keeps only 20.
+_PDF_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+# Key-bound actions that read or write the bibliography; disabled until
+# the initial load has finished.
+_BIB_ACTIONS = frozenset({
+    "fetch", "download_pdfs", "add_survey", "import_txt", "view_articles",
+    "check", "edit_json", "delete_survey", "refresh",
+})
 
 # ── Utility ──────────────────────────────────────────────────
 
 
-def _open_in_editor(path: Path) -> None:
-    """Open *path* in the OS default editor."""
+# Command that opens a file with its default application, per platform.
+_OPEN_COMMANDS = {"Darwin": "open"}
+_OPEN_COMMAND_DEFAULT = "xdg-open"
+
+
+@lru_cache(maxsize=1)
+def _editor_launcher() -> Callable[[Path], Any]:
+    """Resolve the platform's "open with default app" launcher once per process."""
+    import platform
+    import shutil
+    import subprocess
+
     system = platform.system()
     if system == "Windows":
-        os.startfile(str(path))  # type: ignore[attr-defined]
-    elif system == "Darwin":
-        subprocess.Popen(["open", str(path)])
-    else:
-        subprocess.Popen(["xdg-open", str(path)])
+        return lambda path: os.startfile(str(path))  # type: ignore[attr-defined]
+    cmd = _OPEN_COMMANDS.get(system, _OPEN_COMMAND_DEFAULT)
+    # Popen only takes its posix_spawn() fast path (no fork of the whole
+    # TUI process) when given an executable path, so resolve it up front.
+    exe = shutil.which(cmd) or cmd
+    return lambda path: subprocess.Popen([exe, str(path)])
+
+
+def _open_in_editor(path: Path) -> None:
+    """Open *path* in the OS default editor."""
+    _editor_launcher()(path)
+
+
+@lru_cache(maxsize=1)
+def _http2_available() -> bool:
+    """True if the optional ``h2`` package is installed (httpx needs it for HTTP/2)."""
+    from importlib.util import find_spec
+
+    return find_spec("h2") is not None
+
+
+def _pdf_client() -> httpx.AsyncClient:
+    """HTTP client for PDF downloads and IEEE page fetches (see BibliographyApp.http_client)."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(60, connect=10),
+        follow_redirects=True,
+        http2=_http2_available(),
+        limits=_PDF_POOL_LIMITS,
+        headers={"User-Agent": "BibManager/1.0 (mailto:student@example.com)"},
+    )
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Cheap change-detection key for *path*: ``(mtime_ns, size)`` or None."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+async def _download_pdf(
+    client: httpx.AsyncClient, url: str, pdf_dir: Path, stem: str,
+) -> Path:
+    """Stream *url* to ``pdf_dir/<stem>.pdf`` (``.bin`` if not served as PDF).
+
+    Memory stays at one chunk however large the file; a partial file is
+    removed on failure.  Raises RuntimeError("HTTP <code>") on non-200.
+    """
+    async with client.stream("GET", url) as resp:
+        if resp.status_code != 200:
+            raise RuntimeError(f"HTTP {resp.status_code}")
+        ct = (resp.headers.get("content-type") or "").lower()
+        dest = pdf_dir / f"{stem}{'.pdf' if 'pdf' in ct else '.bin'}"
+        try:
+            with dest.open("wb") as fh:
+                async for chunk in resp.aiter_bytes(_PDF_CHUNK_BYTES):
+                    fh.write(chunk)
+        except BaseException:
+            dest.unlink(missing_ok=True)  # don't leave a truncated PDF
+            raise
+    return dest
 
 
 # ── Stats Card ───────────────────────────────────────────────
@@ -68,17 +166,17 @@ class StatsCard(Static):
         super().__init__(**kw)
         self._title = title
         self._value = value
+        self._value_label: Label | None = None
 
     def compose(self) -> ComposeResult:
         yield Label(self._title, classes="stats-title")
-        yield Label(self._value, id="stats-value", classes="stats-value")
+        self._value_label = Label(self._value, id="stats-value", classes="stats-value")
+        yield self._value_label
 
     def update_value(self, value: str) -> None:
         self._value = value
-        try:
-            self.query_one("#stats-value", Label).update(value)
-        except Exception:
-            pass
+        if self._value_label is not None:
+            self._value_label.update(value)
 
 
 # ── Add Survey Modal ─────────────────────────────────────────
@@ -135,6 +233,21 @@ class _ProgressState:
 
 
 def _parse_frac(text: str) -> tuple[int, int] | None:
+    """First ``N/M`` in *text*.
+
+    Progress lines carry the fraction either as a leading ``[N/M]`` or
+    as the first word after ``Prefix: ``; those shapes are split with
+    plain str methods and only other lines fall back to the regex.
+    """
+    head = text.lstrip()
+    if head.startswith("["):
+        token = head[1:].partition("]")[0]
+    else:
+        prefix, _, rest = head.partition(": ")
+        token = "" if "/" in prefix else rest.partition(" ")[0]
+    num, sep, den = token.partition("/")
+    if sep and num.isdecimal() and den.isdecimal():
+        return int(num), int(den)
     m = _FRAC_RE.search(text)
     return (int(m.group(1)), int(m.group(2))) if m else None
 
@@ -153,49 +266,95 @@ class _ProgressDispatcher:
         self._s = state
         self._log = log
         self._bar = bar
-        self._set_phase = set_phase
-        self._set_counter = set_counter
+        self._phase_cb = set_phase
+        self._counter_cb = set_counter
+        # Last text sent to each label: most messages within a phase
+        # repeat it, and Label.update re-renders even for equal text.
+        self._last_phase = ""
+        self._last_counter = ""
+        self._pending_log: list[str] = []
+        self._last_flush = 0.0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Keyed by the text before the first ":" of a (left-stripped)
+        # progress line — one dict lookup instead of a startswith ladder.
+        self._handlers: dict[str, Callable[[str], None]] = {
+            "Phase 1": self._handle_phase1,
+            "Skeleton": self._handle_skeleton,
+            "Phase 1 done": self._handle_phase1_done,
+            "Phase 2": self._phase_setter("Phase 2: resolving DOIs (visiting each ref)\u2026"),
+            "Phase 2 done": self._handle_phase2_done,
+            "Phase 3": self._phase_setter("Phase 3: enriching metadata from Crossref\u2026"),
+            "Crossref": self._handle_crossref,
+            "Phase 3 done": self._phase_setter("Phase 3 complete \u2014 metadata enriched"),
+            "Phase 4": self._phase_setter("Phase 4: downloading PDFs\u2026"),
+            "PDF": self._handle_pdf_progress,
+            "Phase 4 done": self._phase_setter("Phase 4 complete \u2014 PDFs downloaded"),
+            "API": self._handle_api,
+            "Querying Semantic Scholar API...": self._handle_api,
+            "\u2713 Semantic Scholar": self._handle_api,
+        }
 
     # The callback must be a coroutine for the scraper protocol.
     async def __call__(self, msg: str) -> None:
-        self._log.write_line(msg)
-        # Yield to the event loop so the TUI repaints
-        await asyncio.sleep(0)
-
-        if msg.startswith("Phase 1:"):
-            self._handle_phase1(msg)
-        elif msg.strip().startswith("Skeleton:"):
-            self._handle_skeleton(msg)
-        elif msg.startswith("Phase 1 done"):
-            self._handle_phase1_done(msg)
-        elif msg.startswith("Phase 2:"):
-            self._set_phase("Phase 2: resolving DOIs (visiting each ref)\u2026")
-        elif "\u2713" in msg and "[" in msg:
-            self._handle_doi_resolved(msg)
-        elif "\u2717" in msg and "[" in msg:
-            self._handle_doi_failed(msg)
-        elif msg.startswith("Phase 2 done"):
-            self._handle_phase2_done()
-        elif msg.startswith("Phase 3:"):
-            self._set_phase("Phase 3: enriching metadata from Crossref\u2026")
-        elif msg.strip().startswith("Crossref:"):
-            self._handle_crossref(msg)
-        elif msg.startswith("Phase 3 done"):
-            self._set_phase("Phase 3 complete \u2014 metadata enriched")
-        elif msg.startswith("Phase 4:"):
-            self._set_phase("Phase 4: downloading PDFs\u2026")
-        elif msg.strip().startswith("PDF:"):
-            self._handle_pdf_progress(msg)
-        elif msg.startswith("Phase 4 done"):
-            self._set_phase("Phase 4 complete \u2014 PDFs downloaded")
-        elif "Semantic Scholar" in msg or "API:" in msg:
-            self._handle_api(msg)
+        # Strip once here; handlers (and _parse_frac) get the stripped line.
+        line = msg.lstrip()
+
+        # Coalesce log lines: flush and yield to the event loop (so the
+        # TUI repaints) at most once per frame or per _LOG_FLUSH_BATCH
+        # lines, and straight away on a phase change; a timer picks up
+        # whatever is left when messages stop.
+        self._pending_log.append(msg)
+        if (
+            len(self._pending_log) >= _LOG_FLUSH_BATCH
+            or line.startswith("Phase")
+            or time.monotonic() - self._last_flush > _LOG_FLUSH_INTERVAL
+        ):
+            self.flush()
+            await asyncio.sleep(0)
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                _LOG_FLUSH_INTERVAL, self.flush
+            )
+
+        handler = self._handlers.get(line.partition(":")[0])
+        if handler is not None:
+            handler(line)
+        elif line[:1] == "[":
+            # Phase 2 lines: "[i/n] title \u2192 \u2713 doi" / "... \u2192 \u2717 no DOI"
+            status = line.rpartition("\u2192 ")[2][:1]
+            if status == "\u2713":
+                self._handle_doi_resolved(line)
+            elif status == "\u2717":
+                self._handle_doi_failed(line)
+
+    def flush(self) -> None:
+        """Write any buffered progress lines to the log in one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending_log:
+            self._log.write_lines(self._pending_log)
+            self._pending_log.clear()
+        self._last_flush = time.monotonic()
+
+    def _set_phase(self, text: str) -> None:
+        if text != self._last_phase:
+            self._last_phase = text
+            self._phase_cb(text)
+
+    def _set_counter(self, text: str) -> None:
+        if text != self._last_counter:
+            self._last_counter = text
+            self._counter_cb(text)
+
+    def _phase_setter(self, label: str) -> Callable[[str], None]:
+        return lambda _msg: self._set_phase(label)
 
     # ── individual handlers ──────────────────────────────────
 
     def _handle_phase1(self, msg: str) -> None:
         self._set_phase("Phase 1: collecting reference skeletons\u2026")
-        m = re.search(r"found (\d+)", msg)
+        m = _PHASE1_FOUND_RE.search(msg)
         if m:
             self._s.total_refs = int(m.group(1))
             self._bar.update(total=self._s.total_refs * 2, progress=0)
@@ -208,7 +367,7 @@ class _ProgressDispatcher:
             self._set_counter(f"{frac[0]}/{self._s.total_refs} refs collected")
 
     def _handle_phase1_done(self, msg: str) -> None:
-        m = re.search(r"(\d+) DOIs found inline", msg)
+        m = _PHASE1_DOIS_RE.search(msg)
         if m:
             self._s.dois_inline = int(m.group(1))
             self._s.dois_resolved = self._s.dois_inline
@@ -231,7 +390,7 @@ class _ProgressDispatcher:
             self._bar.update(progress=self._s.total_refs + frac[0])
         self._set_counter(f"{self._s.dois_resolved}/{self._s.total_refs} DOIs resolved")
 
-    def _handle_phase2_done(self) -> None:
+    def _handle_phase2_done(self, _msg: str) -> None:
         self._bar.update(progress=self._s.total_refs * 2)
         self._set_phase("Phase 2 complete")
 
@@ -253,7 +412,7 @@ class _ProgressDispatcher:
         if frac:
             self._bar.update(total=frac[1], progress=frac[0])
             self._set_counter(f"{frac[0]}/{frac[1]} entries processed")
-        m2 = re.search(r"(\d+) references", msg)
+        m2 = _API_REFS_RE.search(msg)
         if m2:
             n = int(m2.group(1))
             self._bar.update(total=n, progress=n)
@@ -273,6 +432,8 @@ class FetchProgressModal(ModalScreen[None]):
         self._survey = survey
         self._bib_path = bib_path
         self._fetch_all_callback = fetch_all_callback
+        self._phase_label: Label = None  # type: ignore[assignment]  # set in on_mount
+        self._counter_label: Label = None  # type: ignore[assignment]
 
     def compose(self) -> ComposeResult:
         with Vertical(id="modal-dialog"):
@@ -289,19 +450,20 @@ class FetchProgressModal(ModalScreen[None]):
                 yield Button("Fetch Meta for All", id="btn-fetch-all", disabled=False)
 
     def on_mount(self) -> None:
+        # Resolved once: the progress callbacks update these per message.
+        self._phase_label = self.query_one("#phase-label", Label)
+        self._counter_label = self.query_one("#counter-label", Label)
         self._run_fetch()
 
     def _set_phase(self, text: str) -> None:
-        try:
-            self.query_one("#phase-label", Label).update(text)
-        except Exception:
-            pass
+        # The worker may outlive the modal (closed mid-run).
+        if self.is_attached:
+            self._phase_label.update(text)
 
     def _set_counter(self, text: str) -> None:
-        try:
-            self.query_one("#counter-label", Label).update(text)
-        except Exception:
-            pass
+        # The worker may outlive the modal (closed mid-run).
+        if self.is_attached:
+            self._counter_label.update(text)
 
     @work(exclusive=True)
     async def _run_fetch(self) -> None:
@@ -309,83 +471,118 @@ class FetchProgressModal(ModalScreen[None]):
         bar = self.query_one("#fetch-progress", ProgressBar)
         btn = self.query_one("#btn-close", Button)
 
+        from .scraper import fetch_references
+
         state = _ProgressState()
         dispatcher = _ProgressDispatcher(state, log, bar, self._set_phase, self._set_counter)
 
         try:
-            refs = await fetch_references(
-                self._survey.source,
-                prefer_api=True,
-                progress_callback=dispatcher,
-            )
-            self._merge_results(refs, log)
+            try:
+                refs = await fetch_references(
+                    self._survey.source,
+                    prefer_api=True,
+                    progress_callback=dispatcher,
+                )
+            finally:
+                dispatcher.flush()
+            counts = self._merge_results(refs)
+            # Articles reach disk before the (slow, crawl-delayed) title
+            # lookup, so closing the modal during it loses nothing.
+            self._set_phase("Saving\u2026")
+            await self._save_survey()
             # Rename survey to snake_case of its IEEE title
-            await self._update_survey_name(log)
+            self._set_phase("Fetching survey title\u2026")
+            if await self._update_survey_name(log):
+                await self._save_survey(name=True)
+            self._show_summary(counts, len(refs), log)
         except Exception as exc:
             log.write_line(f"\n\u2717 Error: {exc}")
             self._set_phase("\u2717 Failed")
 
         btn.disabled = False
 
-    async def _update_survey_name(self, log: Log) -> None:
-        """Fetch the survey's own title from IEEE and rename to snake_case."""
+    async def _update_survey_name(self, log: Log) -> bool:
+        """Fetch the survey's own title from IEEE and rename to snake_case.
+
+        Returns True if the survey was renamed (saved by ``_save_survey(name=True)``).
+        """
+        from .scraper import fetch_ieee_title
+
         source = self._survey.source
         if not source.startswith("http"):
-            return
+            return False
         try:
             title = await fetch_ieee_title(source)
             if title:
                 new_name = _to_snake_name(title)
                 if new_name:
                     self._survey.name = new_name
-                    bib = storage.load(self._bib_path)
-                    existing = bib.find_survey(self._survey.id)
-                    if existing:
-                        existing.name = new_name
-                    storage.save(bib, self._bib_path)
                     log.write_line(f"  Survey renamed \u2192 {new_name}")
+                    return True
         except Exception as exc:
             log.write_line(f"  Could not fetch survey title: {exc}")
+        return False
+
+    async def _save_survey(self, *, name: bool = False) -> None:
+        """Write the fetched articles (or, with *name*, just the new name) back.
+
+        The file is re-read rather than overwritten from memory so edits
+        made elsewhere while the fetch ran are kept.  Load, update and
+        save run as one job on a worker thread: the progress widgets keep
+        repainting, and closing the modal (which cancels this worker)
+        can't stop the write half-way.
+        """
+        survey, path = self._survey, self._bib_path
+
+        def write() -> None:
+            bib = storage.load(path)
+            existing = bib.find_survey(survey.id)
+            if existing is None:
+                return
+            if name:
+                existing.name = survey.name
+            else:
+                existing.articles = survey.articles
+                existing.total_references_expected = survey.total_references_expected
+            storage.save(bib, path)
+
+        await asyncio.to_thread(write)
 
-    def _merge_results(self, refs: list[Article], log: Log) -> None:
-        """Merge fetched articles into the survey and save.
+    def _merge_results(self, refs: list[Article]) -> tuple[int, int, int]:
+        """Merge fetched articles into the survey (saved by ``_save_survey``).
 
         Unresolved articles (no DOI) are kept with whatever metadata
         the scraper could extract so the user can search manually.
+        Returns ``(added, with_doi, skipped_dup)`` for ``_show_summary``.
         """
-        added, skipped_dup = 0, 0
+        added, skipped_dup, with_doi = 0, 0, 0
         for art in refs:
+            if not art.doi.startswith("UNRESOLVED"):
+                with_doi += 1
             # De-dup key: real DOI or title-based fallback for unresolved
-            key = art.doi.lower()
-            already = any(
-                a.doi.lower() == key for a in self._survey.articles
-            )
-            if already:
+            if self._survey.has_doi(art.doi):
                 skipped_dup += 1
             else:
-                self._survey.articles.append(art)
+                self._survey.add_article(art)
                 added += 1
 
         self._survey.total_references_expected = max(
             self._survey.total_references_expected, len(refs),
         )
 
-        bib = storage.load(self._bib_path)
-        existing = bib.find_survey(self._survey.id)
-        if existing:
-            existing.articles = self._survey.articles
-            existing.total_references_expected = self._survey.total_references_expected
-        storage.save(bib, self._bib_path)
+        return added, with_doi, skipped_dup
 
-        with_doi = sum(1 for r in refs if not r.doi.startswith("UNRESOLVED"))
-        unresolved = len(refs) - with_doi
+    def _show_summary(self, counts: tuple[int, int, int], total: int, log: Log) -> None:
+        """Report a fetch that has been saved."""
+        added, with_doi, skipped_dup = counts
+        unresolved = total - with_doi
         self._set_phase("\u2713 Complete")
         self._set_counter(
             f"{added} new | {with_doi} DOIs | {unresolved} unresolved (kept) | "
             f"{skipped_dup} duplicates"
         )
         log.write_line(
-            f"\n\u2713 Done \u2014 {added} new, {with_doi}/{len(refs)} with DOI, "
+            f"\n\u2713 Done \u2014 {added} new, {with_doi}/{total} with DOI, "
             f"{unresolved} unresolved (saved with title), {skipped_dup} duplicates"
         )
 
@@ -407,6 +604,15 @@ class FetchProgressModal(ModalScreen[None]):
 # ── Completeness Report Modal ───────────────────────────────
 
 
+_REPORT_BLOCK = (
+    "[bold]{name}[/bold]\n"
+    "  Source: {source}\n"
+    "  References: {fetched}/{expected} ({pct:.0f}%)\n"
+    "  Missing PDF path: {missing_pdf}\n"
+    "  Incomplete metadata: {incomplete}\n"
+).format
+
+
 class CompletenessModal(ModalScreen[None]):
     """Shows per-survey completeness report."""
 
@@ -427,20 +633,21 @@ class CompletenessModal(ModalScreen[None]):
         if not self._bib.surveys:
             container.mount(Label("No surveys added yet."))
             return
-        for survey in self._bib.surveys:
-            container.mount(Static(self._format_survey(survey), markup=True))
+        # One Static for the whole report: a single mount / layout pass
+        # however many surveys there are.
+        body = "\n".join(map(self._format_survey, self._bib.surveys))
+        container.mount(Static(body, markup=True))
 
     @staticmethod
     def _format_survey(s: Survey) -> str:
-        pct = s.completeness * 100
-        missing_pdf = sum(1 for a in s.articles if not a.local_path)
-        incomplete = sum(1 for a in s.articles if not a.title or not a.authors)
-        return (
-            f"[bold]{s.name or s.id}[/bold]\n"
-            f"  Source: {s.source}\n"
-            f"  References: {s.fetched_count}/{s.total_references_expected} ({pct:.0f}%)\n"
-            f"  Missing PDF path: {missing_pdf}\n"
-            f"  Incomplete metadata: {incomplete}\n"
+        return _REPORT_BLOCK(
+            name=s.name or s.id,
+            source=s.source,
+            fetched=s.fetched_count,
+            expected=s.total_references_expected,
+            pct=s.completeness * 100,
+            missing_pdf=sum(1 for a in s.articles if not a.local_path),
+            incomplete=sum(1 for a in s.articles if not a.title or not a.authors),
         )
 
     @on(Button.Pressed, "#btn-close")
@@ -456,6 +663,24 @@ class CompletenessModal(ModalScreen[None]):
 
 _INPUT_DIR = Path("input")
 
+# path → ((mtime_ns, size), parsed entries).  The modal parses each file
+# once to label its button and hands the same list over on click;
+# reopening the modal doesn't re-read unchanged files, and an edited
+# file replaces its own stale slot.
+_TXT_ENTRIES_CACHE: dict[str, tuple[tuple[int, int], list[dict[str, str]]]] = {}
+
+
+def _txt_entries(path: Path) -> list[dict[str, str]]:
+    """``_parse_txt_file(path)``, memoised on the file's stat key."""
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _TXT_ENTRIES_CACHE.get(str(path))
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    entries = _parse_txt_file(path)
+    _TXT_ENTRIES_CACHE[str(path)] = (key, entries)
+    return entries
+
 
 class ImportTxtModal(ModalScreen[list[dict[str, str]] | None]):
     """Let the user pick a .txt file from the input/ folder and import surveys."""
@@ -481,13 +706,10 @@ class ImportTxtModal(ModalScreen[list[dict[str, str]] | None]):
             return
         for f in txt_files:
             btn_id = f"pick-file-{f.stem}"
-            line_count = sum(
-                1 for line in f.read_text(encoding="utf-8", errors="replace").splitlines()
-                if line.strip() and not line.strip().startswith("#")
-            )
+            entry_count = len(_txt_entries(f))
             container.mount(
                 Button(
-                    f"{f.name} ({line_count} entries)",
+                    f"{f.name} ({entry_count} entries)",
                     id=btn_id,
                     classes="survey-pick-btn",
                 )
@@ -498,11 +720,12 @@ class ImportTxtModal(ModalScreen[list[dict[str, str]] | None]):
         btn_id = event.button.id or ""
         stem = btn_id.removeprefix("pick-file-")
         path = _INPUT_DIR / f"{stem}.txt"
-        if not path.exists():
+        try:
+            entries = _txt_entries(path)
+        except FileNotFoundError:
             self.dismiss(None)
             return
-        entries = _parse_txt_file(path)
-        self.dismiss(entries)
+        self.dismiss(list(entries))
 
     @on(Button.Pressed, "#btn-cancel")
     def _on_cancel(self) -> None:
@@ -518,16 +741,24 @@ def _parse_txt_file(path: Path) -> list[dict[str, str]]:
     Each entry dict has keys: source, name, pdf_url, doc_id, type.
     """
     seen: dict[str, dict[str, str]] = {}  # doc_id → entry
-    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        stripped = line.strip()
+    # Split the raw bytes and decode only the lines we keep — blank and
+    # comment lines (most of a large listing) never become str objects.
+    for raw in path.read_bytes().splitlines():
+        raw = raw.strip()
+        if not raw or raw[:1] == b"#":
+            continue
+        stripped = raw.decode("utf-8", "replace").strip()
+        # Re-check after decoding: bytes.strip() only knows ASCII
+        # whitespace, so "\u00a0# note" gets this far.
         if not stripped or stripped.startswith("#"):
             continue
         info = _classify_ieee_url(stripped)
         doc_id = info["doc_id"]
-        if doc_id in seen:
+        entry = seen.get(doc_id)
+        if entry is not None:
             # Merge: prefer a pdf_url if this duplicate provides one
-            if info["pdf_url"] and not seen[doc_id].get("pdf_url"):
-                seen[doc_id]["pdf_url"] = info["pdf_url"]
+            if info["pdf_url"] and not entry["pdf_url"]:
+                entry["pdf_url"] = info["pdf_url"]
             continue
         seen[doc_id] = {
             "source": info["canonical_url"],
@@ -541,26 +772,18 @@ def _parse_txt_file(path: Path) -> list[dict[str, str]]:
 
 def _classify_ieee_url(url: str) -> dict[str, str]:
     """Classify an IEEE URL into document / stamp / direct-PDF."""
-    parsed = urlparse(url)
-    path = parsed.path
+    # Same path / query split urlparse would give, without its overhead —
+    # this runs once per line of an import listing.
+    path, _, query = url.partition("#")[0].partition("?")
 
     # Direct PDF: /ielx7/.../XXXXXXXX.pdf?arnumber=...
-    if path.endswith(".pdf"):
-        qs = parse_qs(parsed.query)
-        arnumber = qs.get("arnumber", [""])[0]
-        if arnumber:
-            return {
-                "type": "pdf",
-                "doc_id": arnumber,
-                "canonical_url": f"https://ieeexplore.ieee.org/document/{arnumber}",
-                "pdf_url": url,
-            }
-
     # Stamp viewer: /stamp/stamp.jsp?...arnumber=...
-    if "/stamp/" in path:
-        qs = parse_qs(parsed.query)
-        arnumber = qs.get("arnumber", [""])[0]
-        if arnumber:
+    if path.endswith(".pdf") or "/stamp/" in path:
+        m = _ARNUMBER_RE.search(query)
+        if m:
+            # Decoded the way parse_qs would, so "arnumber=1%32" still
+            # de-duplicates against /document/12.
+            arnumber = unquote_plus(m.group(1))
             return {
                 "type": "pdf",
                 "doc_id": arnumber,
@@ -597,12 +820,13 @@ def _classify_ieee_url(url: str) -> dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1024)
 def _to_snake_name(title: str) -> str:
     """Convert a paper title to a snake_case filename-safe string."""
     if not title:
         return ""
-    cleaned = re.sub(r"\s+", " ", title).strip()
-    cleaned = re.sub(r"[^\w\s-]", "", cleaned)
+    cleaned = _WHITESPACE_RE.sub(" ", title).strip()
+    cleaned = _NON_NAME_CHARS_RE.sub("", cleaned)
     return snakecase(cleaned)
 
 
@@ -614,10 +838,19 @@ class PDFDownloadModal(ModalScreen[None]):
 
     BINDINGS = [Binding("escape", "close_modal", "Close")]
 
-    def __init__(self, survey: Survey, bib_path: Path, **kw: Any) -> None:
+    def __init__(
+        self,
+        survey: Survey,
+        bib_path: Path,
+        client: httpx.AsyncClient | None = None,
+        **kw: Any,
+    ) -> None:
         super().__init__(**kw)
         self._survey = survey
         self._bib_path = bib_path
+        self._client = client  # None: open (and close) a client just for this run
+        self._phase_label: Label = None  # type: ignore[assignment]  # set in on_mount
+        self._counter_label: Label = None  # type: ignore[assignment]
 
     def compose(self) -> ComposeResult:
         with Vertical(id="modal-dialog"):
@@ -632,19 +865,20 @@ class PDFDownloadModal(ModalScreen[None]):
             yield Button("Close", id="btn-close", disabled=True)
 
     def on_mount(self) -> None:
+        # Resolved once: the progress callbacks update these per message.
+        self._phase_label = self.query_one("#phase-label", Label)
+        self._counter_label = self.query_one("#counter-label", Label)
         self._run_download()
 
     def _set_phase(self, text: str) -> None:
-        try:
-            self.query_one("#phase-label", Label).update(text)
-        except Exception:
-            pass
+        # The worker may outlive the modal (closed mid-run).
+        if self.is_attached:
+            self._phase_label.update(text)
 
     def _set_counter(self, text: str) -> None:
-        try:
-            self.query_one("#counter-label", Label).update(text)
-        except Exception:
-            pass
+        # The worker may outlive the modal (closed mid-run).
+        if self.is_attached:
+            self._counter_label.update(text)
 
     @work(exclusive=True)
     async def _run_download(self) -> None:
@@ -663,53 +897,80 @@ class PDFDownloadModal(ModalScreen[None]):
             btn.disabled = False
             return
 
-        bar.update(total=len(to_dl), progress=0)
-        self._set_phase(f"Downloading {len(to_dl)} PDFs…")
+        total = len(to_dl)
+        bar.update(total=total, progress=0)
+        self._set_phase(f"Downloading {total} PDFs…")
 
-        pdf_dir = Path("bibliography/pdfs")
-        pdf_dir.mkdir(parents=True, exist_ok=True)
+        _PDF_DIR.mkdir(parents=True, exist_ok=True)
 
-        downloaded = 0
-        async with httpx.AsyncClient(
-            timeout=60,
-            follow_redirects=True,
-            headers={"User-Agent": "BibManager/1.0 (mailto:student@example.com)"},
-        ) as client:
-            for i, art in enumerate(to_dl, start=1):
-                title_short = (art.title or art.doi)[:50]
+        from .scraper import _safe_filename
+
+        # Filename stems up front: one sanitising pass per article, done
+        # before any download task starts.
+        stems = {a.doi: _safe_filename(a.doi) for a in to_dl}
+        sem = asyncio.Semaphore(_PDF_CONCURRENCY)
+        host_sems: dict[str, asyncio.Semaphore] = {}
+
+        async def _one(client: httpx.AsyncClient, art: Article) -> tuple[Article, str]:
+            """Download one PDF.  Returns the article and an error ("" if saved)."""
+            try:
+                host = httpx.URL(art.pdf_url).host
+                host_sem = host_sems.get(host)
+                if host_sem is None:
+                    host_sem = host_sems[host] = asyncio.Semaphore(_PDF_PER_HOST)
+                # Per-host slot first, so a download queued behind a busy
+                # host doesn't sit on one of the global slots meanwhile.
+                async with host_sem, sem:
+                    dest = await _download_pdf(
+                        client, art.pdf_url, _PDF_DIR, stems[art.doi],
+                    )
+                art.local_path = str(dest)
+                return art, ""
+            except Exception as exc:
+                return art, str(exc)
+
+        downloaded = done = 0
+        try:
+            async with (
+                contextlib.nullcontext(self._client) if self._client is not None
+                else _pdf_client()
+            ) as client:
+                tasks = [asyncio.create_task(_one(client, art)) for art in to_dl]
                 try:
-                    resp = await client.get(art.pdf_url)
-                    if resp.status_code == 200:
-                        ct = (resp.headers.get("content-type") or "").lower()
-                        ext = ".pdf" if "pdf" in ct else ".bin"
-                        from .scraper import _safe_filename
-                        dest = pdf_dir / f"{_safe_filename(art.doi)}{ext}"
-                        dest.write_bytes(resp.content)
-                        art.local_path = str(dest)
-                        downloaded += 1
-                        log.write_line(f"  ✓ [{i}/{len(to_dl)}] {title_short}")
-                    else:
-                        log.write_line(
-                            f"  ✗ [{i}/{len(to_dl)}] {title_short} "
-                            f"— HTTP {resp.status_code}"
-                        )
-                except Exception as exc:
-                    log.write_line(f"  ✗ [{i}/{len(to_dl)}] {title_short} — {exc}")
+                    for next_done in asyncio.as_completed(tasks):
+                        art, error = await next_done
+                        done += 1
+                        head = f"[{done}/{total}] {(art.title or art.doi)[:50]}"
+                        if error:
+                            log.write_line(f"  ✗ {head} — {error}")
+                        else:
+                            downloaded += 1
+                            log.write_line(f"  ✓ {head}")
+                        bar.update(progress=done)
+                        self._set_counter(f"{downloaded}/{done} downloaded")
+                finally:
+                    for task in tasks:
+                        task.cancel()
+        finally:
+            # Runs even if the modal is closed mid-run, so every PDF that
+            # did land keeps its local_path.
+            if any(a.local_path for a in to_dl):
+                await self._save_articles()
+
+        self._set_phase(f"✓ Downloaded {downloaded}/{total} PDFs")
+        log.write_line(f"\n✓ Done — {downloaded}/{total} PDFs saved to {_PDF_DIR}")
+        btn.disabled = False
 
-                bar.update(progress=i)
-                self._set_counter(f"{downloaded}/{i} downloaded")
-                await asyncio.sleep(0.1)
+    async def _save_articles(self) -> None:
+        """Write the survey's articles (new local_path values) back to disk.
 
-        # Save updated local_path values
-        bib = storage.load(self._bib_path)
+        Load / save run off the event loop, as in FetchProgressModal.
+        """
+        bib = await asyncio.to_thread(storage.load, self._bib_path)
         existing = bib.find_survey(self._survey.id)
         if existing:
             existing.articles = self._survey.articles
-        storage.save(bib, self._bib_path)
-
-        self._set_phase(f"✓ Downloaded {downloaded}/{len(to_dl)} PDFs")
-        log.write_line(f"\n✓ Done — {downloaded}/{len(to_dl)} PDFs saved to {pdf_dir}")
-        btn.disabled = False
+        await asyncio.to_thread(storage.save, bib, self._bib_path)
 
     @on(Button.Pressed, "#btn-close")
     def _on_close(self) -> None:
@@ -812,20 +1073,19 @@ class ArticleListScreen(ModalScreen[None]):
     def on_mount(self) -> None:
         table = self.query_one("#article-table", DataTable)
         table.add_columns("#", "DOI", "Title", "Authors", "Year", "PDF")
-        for i, art in enumerate(self._survey.articles, start=1):
-            doi_display = (
-                "⚠ no DOI" if art.doi.startswith("UNRESOLVED") else
-                _truncate(art.doi, 30)
-            )
-            pdf_status = _pdf_status_icon(art)
-            table.add_row(
+        rows = [
+            (
                 str(i),
-                doi_display,
+                "⚠ no DOI" if art.doi.startswith("UNRESOLVED") else _truncate(art.doi, 30),
                 _truncate(art.title, 55),
                 _format_authors(art.authors),
                 str(art.year or "—"),
-                pdf_status,
+                _pdf_status_icon(art),
             )
+            for i, art in enumerate(self._survey.articles, start=1)
+        ]
+        with self.app.batch_update():
+            table.add_rows(rows)
 
     @on(Button.Pressed, "#btn-close")
     def _on_close(self) -> None:
@@ -836,14 +1096,37 @@ class ArticleListScreen(ModalScreen[None]):
 
 
 def _truncate(text: str, limit: int) -> str:
-    return text[:limit] + ("\u2026" if len(text) > limit else "")
+    return text if len(text) <= limit else text[:limit] + "\u2026"
 
 
 def _format_authors(authors: list[str]) -> str:
-    result = ", ".join(authors[:3])
-    if len(authors) > 3:
-        result += " et al."
-    return result
+    if len(authors) <= 3:
+        return ", ".join(authors)
+    return ", ".join(authors[:3]) + " et al."
+
+
+@lru_cache(maxsize=1024)
+def _survey_row(
+    label: str,
+    source: str,
+    fetched: int,
+    expected: int,
+    completeness: float,
+    added: date,
+) -> tuple[str, ...]:
+    """Display cells for one dashboard row.
+
+    Memoised on the survey's raw fields, so unchanged surveys cost one
+    cache lookup per refresh instead of a slice + three formats.
+    """
+    return (
+        label,
+        _truncate(source, 50),
+        str(fetched),
+        str(expected),
+        f"{completeness * 100:.0f}%",
+        str(added),
+    )
 
 
 def _pdf_status_icon(art: Article) -> str:
@@ -992,10 +1275,30 @@ class BibliographyApp(App[None]):
     def __init__(self, bib_path: str | Path | None = None, **kw: Any) -> None:
         super().__init__(**kw)
         self.bib_path = storage.resolve_path(bib_path)
-        self.bib = storage.load(self.bib_path)
-        self._bib_mtime: float = (
-            self.bib_path.stat().st_mtime if self.bib_path.exists() else 0.0
-        )
+        # Placeholder until _load_bibliography has parsed the JSON off the
+        # event loop; actions stay disabled so nothing can save over it.
+        self.bib = Bibliography()
+        self._bib_loaded = False
+        # Change detection: the file watcher sets _bib_dirty; without one
+        # we fall back to comparing stat keys on every refresh.
+        self._watcher: BibFileWatcher | None = None
+        self._bib_dirty = False
+        self._bib_stat_key: tuple[int, int] | None = None
+        self._bib_version = 0  # bumped on every (re)load or in-place edit of self.bib
+        # True while a worker holds edits to self.bib it hasn't saved yet;
+        # the dashboard must not reload the file over them.
+        self._bib_unsaved = False
+        self._bib_saves_pending = 0  # _save_bib workers still writing the file
+        self._refresh_timer: Timer | None = None  # see _request_refresh
+        # (bib version, stats, rows) of the last render — see _refresh_dashboard
+        self._dashboard_cache: tuple[int, tuple[str, ...], dict[str, tuple[str, ...]]] | None = None
+        self._survey_columns: list[ColumnKey] = []
+        # Shared by PDF downloads and IEEE title fetches so keep-alive
+        # connections (and TLS sessions) survive across modals and imports.
+        self._http: httpx.AsyncClient | None = None
+        # Widget handles resolved once in on_mount.
+        self._survey_table: DataTable = None  # type: ignore[assignment]
+        self._stat_cards: tuple[StatsCard, ...] = ()
 
     # ── compose ──────────────────────────────────────────────
 
@@ -1022,54 +1325,202 @@ class BibliographyApp(App[None]):
         yield Footer()
 
     def on_mount(self) -> None:
-        table = self.query_one("#survey-table", DataTable)
-        table.add_columns("Survey", "Source", "Refs", "Expected", "%", "Added")
+        table = self._survey_table = self.query_one("#survey-table", DataTable)
+        self._stat_cards = tuple(
+            self.query_one(f"#stat-{name}", StatsCard)
+            for name in ("surveys", "articles", "completeness", "pdfs")
+        )
+        self._survey_columns = table.add_columns(
+            "Survey", "Source", "Refs", "Expected", "%", "Added",
+        )
+        table.loading = True
+        self.query_one("#button-bar").disabled = True
+        self._watcher = BibFileWatcher.start(self.bib_path, self._on_bib_file_event)
+        self._load_bibliography()
+        self._warmup()
+
+    @work(exclusive=True, group="load")
+    async def _load_bibliography(self) -> None:
+        """Parse the JSON in a thread so the first frame doesn't wait on it."""
+        self._bib_stat_key = _stat_key(self.bib_path)
+        self.bib = await asyncio.to_thread(storage.load, self.bib_path)
+        self._bib_version += 1
+        self._bib_loaded = True
+        self._survey_table.loading = False
+        self.query_one("#button-bar").disabled = False
+        self.refresh_bindings()
         self._refresh_dashboard()
 
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        if not self._bib_loaded and action in _BIB_ACTIONS:
+            return False
+        return super().check_action(action, parameters)
+
+    def http_client(self) -> httpx.AsyncClient:
+        """The app-wide HTTP client, created on first use."""
+        if self._http is None:
+            self._http = _pdf_client()
+        return self._http
+
+    async def on_unmount(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    # ── bibliography file watching ───────────────────────────
+
+    class BibFileChanged(Message):
+        """The bibliography JSON changed on disk (posted from the watcher thread)."""
+
+    def _on_bib_file_event(self) -> None:
+        # Runs on the watchdog thread; post_message is thread-safe.
+        self.post_message(self.BibFileChanged())
+
+    def on_bibliography_app_bib_file_changed(self, _: BibFileChanged) -> None:
+        self._bib_dirty = True
+        if self._bib_loaded:
+            self._request_refresh()
+
+    def _bib_changed(self) -> bool:
+        """True (once) if the JSON file changed since self.bib was loaded."""
+        if self._watcher is not None:
+            changed, self._bib_dirty = self._bib_dirty, False
+            return changed
+        key = _stat_key(self.bib_path)
+        changed = key != self._bib_stat_key
+        self._bib_stat_key = key
+        return changed
+
+    @work(thread=True, exclusive=False, group="warmup")
+    def _warmup(self) -> None:
+        """Pre-import the scraper stack once the dashboard has painted.
+
+        ``.scraper`` (Playwright + its protocol modules) is deferred so it
+        stays off the startup path; importing it here in the background
+        means the first Fetch doesn't stall on it either.
+        """
+        from . import scraper  # noqa: F401
+
     # ── dashboard refresh ────────────────────────────────────
 
+    def _request_refresh(self) -> None:
+        """Schedule a _refresh_dashboard, coalescing bursts of requests.
+
+        One save fires several watcher events, and imports re-render per
+        survey; everything asked for within _REFRESH_COALESCE seconds of
+        the first request is served by a single render.
+        """
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(_REFRESH_COALESCE, self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        self._refresh_timer = None
+        self._refresh_dashboard()
+
     def _refresh_dashboard(self, *, force: bool = False) -> None:
         # Only re-parse the JSON when the file has actually changed on disk.
-        current_mtime = (
-            self.bib_path.stat().st_mtime if self.bib_path.exists() else 0.0
-        )
-        if force or current_mtime != self._bib_mtime:
+        if force or (
+            not self._bib_unsaved and not self._bib_saves_pending and self._bib_changed()
+        ):
             self.bib = storage.load(self.bib_path)
-            self._bib_mtime = current_mtime
+            self._bib_version += 1
+
+        cache = self._dashboard_cache
+        if not force and cache is not None and cache[0] == self._bib_version:
+            return  # nothing changed since the last render
 
         bib = self.bib
 
-        total_surveys = len(bib.surveys)
-        total_articles = bib.total_unique_articles
-        completeness = 0.0
-        if bib.surveys:
-            completeness = sum(s.completeness for s in bib.surveys) / len(bib.surveys)
-        pdfs = sum(1 for a in bib.unique_articles.values() if a.local_path)
-
-        self.query_one("#stat-surveys", StatsCard).update_value(str(total_surveys))
-        self.query_one("#stat-articles", StatsCard).update_value(str(total_articles))
-        self.query_one("#stat-completeness", StatsCard).update_value(f"{completeness * 100:.0f}%")
-        self.query_one("#stat-pdfs", StatsCard).update_value(str(pdfs))
-
-        table = self.query_one("#survey-table", DataTable)
-        table.clear()
+        # One pass over the surveys: each one's completeness feeds both its
+        # row and the average.
+        rows: dict[str, tuple[str, ...]] = {}
+        completeness_sum = 0.0
         for s in bib.surveys:
-            table.add_row(
+            pct = s.completeness
+            completeness_sum += pct
+            rows[s.id] = _survey_row(
                 s.name or s.id,
-                _truncate(s.source, 50),
-                str(s.fetched_count),
-                str(s.total_references_expected),
-                f"{s.completeness * 100:.0f}%",
-                str(s.date_added),
+                s.source,
+                s.fetched_count,
+                s.total_references_expected,
+                pct,
+                s.date_added,
             )
 
+        total_surveys = len(bib.surveys)
+        unique = bib.unique_articles
+        total_articles = len(unique)
+        completeness = completeness_sum / total_surveys if total_surveys else 0.0
+        pdfs = sum(1 for a in unique.values() if a.local_path)
+
+        stats = (str(total_surveys), str(total_articles), f"{completeness * 100:.0f}%", str(pdfs))
+        self._dashboard_cache = (self._bib_version, stats, rows)
+
+        if cache is None or cache[1] != stats:
+            for card, value in zip(self._stat_cards, stats):
+                card.update_value(value)
+
+        if cache is None or cache[2] != rows:
+            self._sync_survey_table(cache[2] if cache else {}, rows)
+
+    def _sync_survey_table(
+        self,
+        old: dict[str, tuple[str, ...]],
+        new: dict[str, tuple[str, ...]],
+    ) -> None:
+        """Apply the difference between two ``survey id → row`` maps to the table.
+
+        Rows are keyed by survey id, so only added / removed surveys and
+        the individual cells that changed are touched.  Falls back to a
+        full rebuild on the first fill and when surveys were reordered (or
+        ids are duplicated).  Either way every change lands in a single
+        batch_update, so the table repaints once.
+        """
+        table = self._survey_table
+        kept_old = [sid for sid in old if sid in new]
+        kept_new = [sid for sid in new if sid in old]
+        with self.app.batch_update():
+            if not old or kept_old != kept_new or len(new) != len(self.bib.surveys):
+                table.clear()
+                for sid, row in new.items():
+                    table.add_row(*row, key=sid)
+                return
+
+            for sid in old.keys() - new.keys():
+                table.remove_row(sid)
+            for sid, row in new.items():
+                prev = old.get(sid)
+                if prev is None:
+                    table.add_row(*row, key=sid)
+                    continue
+                for col, value, before in zip(self._survey_columns, row, prev):
+                    if value != before:
+                        table.update_cell(sid, col, value)
+
     # ── actions ──────────────────────────────────────────────
 
     def action_refresh(self) -> None:
+        # R always re-reads the file, so a change the watcher missed
+        # (network drive, unusual editor save) can still be picked up —
+        # unless a worker holds edits that haven't reached disk yet.
+        if self._bib_unsaved or self._bib_saves_pending:
+            self._refresh_dashboard()
+            self.notify("Save in progress \u2014 showing unsaved changes", severity="warning")
+            return
         self._refresh_dashboard(force=True)
         self.notify("Dashboard refreshed")
 
-    def action_quit(self) -> None:
+    async def action_quit(self) -> None:
+        # Textual only cancels workers once the app is already shutting
+        # down and never waits for them; cancel and await them here so
+        # their cleanup (e.g. the TXT import's final save) gets to finish.
+        workers = list(self.workers)
+        self.workers.cancel_all()
+        # return_exceptions: a cancelled worker's wait() raises WorkerCancelled.
+        await asyncio.gather(*(w.wait() for w in workers), return_exceptions=True)
         self.exit()
 
     def action_edit_json(self) -> None:
@@ -1087,13 +1538,12 @@ class BibliographyApp(App[None]):
         source = result["source"]
         name = result.get("name", "")
         survey_id = source
-        if self.bib.find_survey(survey_id):
+        if survey_id in self.bib.survey_ids:
             self.notify("Survey already exists", severity="warning")
             return
         survey = Survey(id=survey_id, name=name, source=source, date_added=date.today())
-        self.bib.surveys.append(survey)
-        storage.save(self.bib, self.bib_path)
-        self._refresh_dashboard()
+        self.bib.add_survey(survey)
+        self._save_bib()
         self.notify(f"Survey added: {name or source}")
 
     def action_fetch(self) -> None:
@@ -1129,61 +1579,83 @@ class BibliographyApp(App[None]):
 
     @work(exclusive=True)
     async def _import_surveys_sequentially(self, entries: list[dict[str, str]]) -> None:
-        """Import surveys one-by-one, fetch title for each, save, then next.
-        
-        Ensures no rate-limiting and clear sequential progress.
+        """Import surveys one-by-one, fetching each title as it is added.
+
+        Rows appear on the dashboard immediately; the file is saved every
+        _IMPORT_SAVE_EVERY surveys and once more when the import ends.
         """
+        from .scraper import fetch_ieee_meta
+
         added, skipped, queued = 0, 0, 0
-        
-        for i, entry in enumerate(entries, start=1):
-            source = entry["source"]
-            name = entry.get("name", "")
-            pdf_url = entry.get("pdf_url", "")
-            
-            # Skip if already exists
-            if self.bib.find_survey(source):
-                skipped += 1
-                continue
-            
-            # Create survey with placeholder name
-            survey = Survey(
-                id=source, name=name, source=source,
-                date_added=date.today(), pdf_url=pdf_url,
-            )
-            self.bib.surveys.append(survey)
-            added += 1
-            
-            if pdf_url:
-                queued += 1
-            
-            # Try to fetch real title immediately
-            if name.startswith("ieee_") and source.startswith("http"):
-                try:
-                    self.notify(
-                        f"[{i}/{len(entries)}] Fetching title for {source[:50]}…",
-                        severity="information",
-                    )
-                    meta = await fetch_ieee_meta(source)
-                    title = meta.get("title", "")
-                    if title:
-                        real_name = _to_snake_name(title)
-                        if real_name:
-                            survey.name = real_name
-                            self.notify(
-                                f"  ✓ Renamed: {real_name[:50]}",
-                                severity="information",
-                            )
-                    await asyncio.sleep(10.0)  # Rate limit between fetches
-                except Exception as exc:
-                    self.notify(
-                        f"  ⚠ Could not fetch title: {exc}",
-                        severity="warning",
-                    )
-            
-            # Save after each survey
-            storage.save(self.bib, self.bib_path)
+        unsaved = 0
+
+        async def checkpoint() -> None:
+            nonlocal unsaved
+            await asyncio.to_thread(storage.save, self.bib, self.bib_path)
+            unsaved = 0
+            self._bib_unsaved = False
             self._refresh_dashboard()
-        
+
+        try:
+            for i, entry in enumerate(entries, start=1):
+                source = entry["source"]
+                name = entry.get("name", "")
+                pdf_url = entry.get("pdf_url", "")
+
+                # Skip if already exists
+                if source in self.bib.survey_ids:
+                    skipped += 1
+                    continue
+
+                # Create survey with placeholder name
+                survey = Survey(
+                    id=source, name=name, source=source,
+                    date_added=date.today(), pdf_url=pdf_url,
+                )
+                self.bib.add_survey(survey)
+                added += 1
+                # Show the new row now; it reaches disk at the next checkpoint.
+                unsaved += 1
+                self._bib_unsaved = True
+                self._bib_version += 1
+                self._request_refresh()
+
+                if pdf_url:
+                    queued += 1
+
+                # Try to fetch real title immediately
+                if name.startswith("ieee_") and source.startswith("http"):
+                    try:
+                        self.notify(
+                            f"[{i}/{len(entries)}] Fetching title for {source[:50]}…",
+                            severity="information",
+                        )
+                        meta = await fetch_ieee_meta(source, self.http_client())
+                        title = meta.get("title", "")
+                        if title:
+                            real_name = _to_snake_name(title)
+                            if real_name:
+                                survey.name = real_name
+                                self._bib_version += 1
+                                self._request_refresh()
+                                self.notify(
+                                    f"  ✓ Renamed: {real_name[:50]}",
+                                    severity="information",
+                                )
+                    except Exception as exc:
+                        self.notify(
+                            f"  ⚠ Could not fetch title: {exc}",
+                            severity="warning",
+                        )
+
+                # Checkpoint every few surveys rather than re-writing the whole
+                # file per entry; the finally below saves the remainder.
+                if unsaved >= _IMPORT_SAVE_EVERY:
+                    await checkpoint()
+        finally:
+            if unsaved:
+                await checkpoint()
+
         # Final summary
         parts = [f"Imported {added} surveys"]
         if skipped:
@@ -1198,8 +1670,10 @@ class BibliographyApp(App[None]):
 
         Fully decoupled from PDF downloads — only touches survey names.
         Uses exclusive=True to prevent races with other workers.
-        Sequential fetching with 10s delay between each URL (IEEE robots.txt).
+        Sequential; fetch_ieee_meta spaces live requests 10s apart (IEEE robots.txt).
         """
+        from .scraper import fetch_ieee_meta
+
         to_rename = [
             s.id for s in self.bib.surveys
             if s.name.startswith("ieee_") and s.source.startswith("http")
@@ -1222,7 +1696,7 @@ class BibliographyApp(App[None]):
             self.notify(f"[{i}/{len(to_rename)}] Fetching {survey.source[:60]}…", severity="information")
             
             try:
-                meta = await fetch_ieee_meta(survey.source)
+                meta = await fetch_ieee_meta(survey.source, self.http_client())
                 title = meta.get("title", "")
                 if title:
                     new_name = _to_snake_name(title)
@@ -1230,7 +1704,7 @@ class BibliographyApp(App[None]):
                     survey = self.bib.find_survey(survey_id)
                     if survey and new_name:
                         survey.name = new_name
-                        storage.save(self.bib, self.bib_path)
+                        await asyncio.to_thread(storage.save, self.bib, self.bib_path)
                         renamed += 1
                         self.notify(f"  ✓ Renamed to: {new_name[:50]}", severity="information")
                 else:
@@ -1240,10 +1714,6 @@ class BibliographyApp(App[None]):
                 failed += 1
                 error_msg = str(exc)
                 self.notify(f"  ✗ Error: {error_msg}", severity="error")
-            
-            # Always delay AFTER each URL (including failures) to respect rate limits
-            if i < len(to_rename):
-                await asyncio.sleep(10.0)
         
         self._refresh_dashboard()
         parts = [f"Renamed {renamed}/{len(to_rename)} surveys"]
@@ -1260,36 +1730,23 @@ class BibliographyApp(App[None]):
         if not survey or not survey.pdf_url:
             return
 
-        pdf_dir = Path("bibliography/pdfs")
-        pdf_dir.mkdir(parents=True, exist_ok=True)
+        _PDF_DIR.mkdir(parents=True, exist_ok=True)
         self.notify(f"Downloading PDF for {survey.name}…", severity="information")
 
         try:
-            async with httpx.AsyncClient(
-                timeout=60,
-                follow_redirects=True,
-                headers={"User-Agent": "BibManager/1.0 (mailto:student@example.com)"},
-            ) as client:
-                resp = await client.get(survey.pdf_url)
-                if resp.status_code == 200:
-                    ct = (resp.headers.get("content-type") or "").lower()
-                    ext = ".pdf" if "pdf" in ct else ".bin"
-                    doc_part = survey.source.rsplit("/", 1)[-1]
-                    dest = pdf_dir / f"survey_{_safe_filename(doc_part)}{ext}"
-                    dest.write_bytes(resp.content)
-                    # Re-lookup before saving
-                    survey = self.bib.find_survey(survey_id)
-                    if survey:
-                        survey.local_path = str(dest)
-                        survey.pdf_url = ""  # clear queue
-                        storage.save(self.bib, self.bib_path)
-                    self._refresh_dashboard()
-                    self.notify(f"PDF saved: {dest.name}", severity="information")
-                else:
-                    self.notify(
-                        f"PDF download failed: HTTP {resp.status_code}",
-                        severity="error",
-                    )
+            doc_part = survey.source.rsplit("/", 1)[-1]
+            dest = await _download_pdf(
+                self.http_client(), survey.pdf_url, _PDF_DIR,
+                f"survey_{_safe_filename(doc_part)}",
+            )
+            # Re-lookup before saving
+            survey = self.bib.find_survey(survey_id)
+            if survey:
+                survey.local_path = str(dest)
+                survey.pdf_url = ""  # clear queue
+                await asyncio.to_thread(storage.save, self.bib, self.bib_path)
+            self._refresh_dashboard()
+            self.notify(f"PDF saved: {dest.name}", severity="information")
         except Exception as exc:
             self.notify(f"PDF download failed: {exc}", severity="error")
 
@@ -1304,11 +1761,25 @@ class BibliographyApp(App[None]):
             self.notify("Survey not found", severity="error")
             return
         name = survey.name or survey.source
-        self.bib.surveys = [s for s in self.bib.surveys if s.id != survey_id]
-        storage.save(self.bib, self.bib_path)
-        self._refresh_dashboard()
+        self.bib.remove_survey(survey_id)
+        self._save_bib()
         self.notify(f"Deleted: {name}", severity="information")
 
+    def _save_bib(self) -> None:
+        """Show an in-place edit of self.bib now and write it in the background."""
+        self._bib_saves_pending += 1
+        self._bib_version += 1
+        self._refresh_dashboard()
+        self._write_bib()
+
+    @work(exclusive=False, group="save")
+    async def _write_bib(self) -> None:
+        try:
+            await asyncio.to_thread(storage.save, self.bib, self.bib_path)
+        finally:
+            self._bib_saves_pending -= 1
+        self._request_refresh()
+
     # ── survey picking helpers ───────────────────────────────
 
     def _pick_survey_then(self, callback: Any) -> None:
@@ -1335,7 +1806,7 @@ class BibliographyApp(App[None]):
                 self.bib_path,
                 fetch_all_callback=self._fetch_imported_titles,
             ),
-            callback=lambda _: self._refresh_dashboard(),
+            callback=lambda _: self._request_refresh(),
         )
 
     def _start_download(self, survey_id: str) -> None:
@@ -1352,8 +1823,8 @@ class BibliographyApp(App[None]):
             self.notify("No downloadable PDFs for this survey", severity="warning")
             return
         self.push_screen(
-            PDFDownloadModal(survey, self.bib_path),
-            callback=lambda _: self._refresh_dashboard(),
+            PDFDownloadModal(survey, self.bib_path, client=self.http_client()),
+            callback=lambda _: self._request_refresh(),
         )
 
     def _show_articles(self, survey_id: str) -> None:
@@ -1405,5 +1876,5 @@ class BibliographyApp(App[None]):
         self.action_delete_survey()
 
     @on(Button.Pressed, "#btn-quit")
-    def _btn_quit(self) -> None:
-        self.action_quit()
+    async def _btn_quit(self) -> None:
+        await self.action_quit()
@@ -0,0 +1,121 @@
+"""On-disk cache for network lookups (Crossref records, IEEE page metadata).
+
+A single SQLite table of JSON values with an expiry time, so re-fetching
+a survey minutes (or weeks) later doesn't repeat every Crossref / IEEE
+request.  Any SQLite failure degrades to a cache miss — the cache must
+never be the reason a fetch fails.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+DEFAULT_PATH = Path("bibliography") / "cache.sqlite3"
+
+# Crossref metadata and IEEE titles rarely change; 90 days keeps repeat
+# fetches offline without pinning stale records forever.
+DEFAULT_TTL = 90 * 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key     TEXT PRIMARY KEY,
+    value   BLOB NOT NULL,
+    expires REAL NOT NULL
+)
+"""
+
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        DEFAULT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(DEFAULT_PATH, check_same_thread=False)
+        conn.execute(_SCHEMA)
+        try:
+            # WAL + NORMAL: a commit appends to the log without an fsync;
+            # losing the last few entries in a power cut only costs refetches.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error:
+            pass  # e.g. a filesystem without shared-memory support
+        _conn = conn
+    return _conn
+
+
+# Keys per SELECT in get_many — below SQLite's bound-parameter limit
+# (999 on builds older than 3.32).
+_GET_CHUNK = 500
+
+
+def get(key: str) -> Any | None:
+    """Return the cached value for *key*, or None if missing / expired."""
+    return get_many([key]).get(key)
+
+
+def get_many(keys: Iterable[str]) -> dict[str, Any]:
+    """Return ``{key: value}`` for those *keys* that are cached and fresh.
+
+    Blocking (SQLite query); async callers run it via ``asyncio.to_thread``.
+    Missing, expired and unreadable (corrupt / truncated) rows are left out.
+    """
+    keys = list(dict.fromkeys(keys))
+    rows: list[tuple[str, bytes, float]] = []
+    try:
+        with _lock:
+            conn = _connect()
+            for start in range(0, len(keys), _GET_CHUNK):
+                chunk = keys[start:start + _GET_CHUNK]
+                rows += conn.execute(
+                    "SELECT key, value, expires FROM cache WHERE key IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+    except (sqlite3.Error, OSError):
+        return {}
+    now = time.time()
+    found: dict[str, Any] = {}
+    for key, blob, expires in rows:
+        if expires < now:
+            continue
+        try:
+            found[key] = json.loads(blob)
+        except ValueError:  # includes UnicodeDecodeError
+            continue
+    return found
+
+
+def put(key: str, value: Any, ttl: float = DEFAULT_TTL) -> None:
+    """Store *value* (JSON-serialisable) under *key* for *ttl* seconds."""
+    put_many([(key, value)], ttl)
+
+
+def put_many(items: Iterable[tuple[str, Any]], ttl: float = DEFAULT_TTL) -> None:
+    """Store several ``(key, value)`` pairs in one transaction.
+
+    Blocking (SQLite commit); async callers run it via ``asyncio.to_thread``.
+    """
+    expires = time.time() + ttl
+    rows = [
+        (key, json.dumps(value, separators=(",", ":")).encode("utf-8"), expires)
+        for key, value in items
+    ]
+    if not rows:
+        return
+    try:
+        with _lock:
+            conn = _connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+    except (sqlite3.Error, OSError):
+        pass
@@ -6,9 +6,9 @@ Strict schema for the JSON file that lives inside the Obsidian vault.
 from __future__ import annotations
 
 from datetime import date
-from typing import Optional
+from typing import KeysView, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Article(BaseModel):
@@ -44,6 +44,10 @@ class Survey(BaseModel):
     local_path: str = ""
     articles: list[Article] = Field(default_factory=list)
 
+    # Lower-cased DOI set, tagged like Bibliography's survey index.
+    _doi_set: set[str] = PrivateAttr(default_factory=set)
+    _doi_set_of: tuple[list[Article], int] | None = PrivateAttr(default=None)
+
     # ── helpers ────────────────────────────────────────────────
     @property
     def fetched_count(self) -> int:
@@ -55,8 +59,26 @@ class Survey(BaseModel):
             return 0.0
         return min(self.fetched_count / self.total_references_expected, 1.0)
 
+    def _dois(self) -> set[str]:
+        built_from = self._doi_set_of
+        if (
+            built_from is None
+            or built_from[0] is not self.articles
+            or built_from[1] != len(self.articles)
+        ):
+            self._doi_set = {a.doi.lower() for a in self.articles}
+            self._doi_set_of = (self.articles, len(self.articles))
+        return self._doi_set
+
     def has_doi(self, doi: str) -> bool:
-        return any(a.doi.lower() == doi.lower() for a in self.articles)
+        return doi.lower() in self._dois()
+
+    def add_article(self, article: Article) -> None:
+        """Append *article*, keeping the DOI set current."""
+        dois = self._dois()
+        self.articles.append(article)
+        dois.add(article.doi.lower())
+        self._doi_set_of = (self.articles, len(self.articles))
 
 
 class Project(BaseModel):
@@ -76,24 +98,93 @@ class Bibliography(BaseModel):
     project: Project = Field(default_factory=Project)
     surveys: list[Survey] = Field(default_factory=list)
 
+    # id → Survey index, tagged with the list (and its length) it was built
+    # from so direct ``surveys`` edits just trigger a rebuild.
+    _survey_index: dict[str, Survey] = PrivateAttr(default_factory=dict)
+    _survey_index_of: tuple[list[Survey], int] | None = PrivateAttr(default=None)
+
+    # DOI → Article map, tagged with the surveys list and each survey's
+    # article list (held, not just their ids) plus lengths it was built from.
+    _unique: dict[str, Article] = PrivateAttr(default_factory=dict)
+    _unique_of: tuple[list[Survey], list[tuple[list[Article], int]]] | None = (
+        PrivateAttr(default=None)
+    )
+
     # ── helpers ────────────────────────────────────────────────
+    def _unique_is_current(self) -> bool:
+        """True if no list ``unique_articles`` reads changed since it was built.
+
+        O(surveys) rather than O(articles): appends, removals and list
+        replacements are caught; in-place DOI edits are not.  The lists
+        are compared with ``is`` — the tag keeps them alive, so a freed
+        list's address can't be reused by its replacement.
+        """
+        built_from = self._unique_of
+        if built_from is None or built_from[0] is not self.surveys:
+            return False
+        lists = built_from[1]
+        return len(lists) == len(self.surveys) and all(
+            articles is s.articles and n == len(articles)
+            for (articles, n), s in zip(lists, self.surveys)
+        )
+
     @property
     def unique_articles(self) -> dict[str, Article]:
-        """De-duplicated map of DOI → first-seen Article across all surveys."""
-        seen: dict[str, Article] = {}
-        for survey in self.surveys:
-            for art in survey.articles:
-                key = art.doi.lower()
-                if key not in seen:
-                    seen[key] = art
-        return seen
+        """De-duplicated map of DOI → first-seen Article across all surveys.
+
+        Memoised until a survey or article list changes; treat the
+        returned dict as read-only.
+        """
+        if not self._unique_is_current():
+            seen: dict[str, Article] = {}
+            for survey in self.surveys:
+                for art in survey.articles:
+                    seen.setdefault(art.doi.lower(), art)
+            self._unique = seen
+            self._unique_of = (
+                self.surveys,
+                [(s.articles, len(s.articles)) for s in self.surveys],
+            )
+        return self._unique
 
     @property
     def total_unique_articles(self) -> int:
         return len(self.unique_articles)
 
+    def _surveys_by_id(self) -> dict[str, Survey]:
+        built_from = self._survey_index_of
+        if (
+            built_from is None
+            or built_from[0] is not self.surveys
+            or built_from[1] != len(self.surveys)
+        ):
+            # reversed() so the first survey with a given id wins, as before
+            self._survey_index = {s.id: s for s in reversed(self.surveys)}
+            self._survey_index_of = (self.surveys, len(self.surveys))
+        return self._survey_index
+
+    @property
+    def survey_ids(self) -> KeysView[str]:
+        """Live, O(1)-membership view of the survey ids."""
+        return self._surveys_by_id().keys()
+
     def find_survey(self, survey_id: str) -> Survey | None:
-        for s in self.surveys:
-            if s.id == survey_id:
-                return s
-        return None
+        return self._surveys_by_id().get(survey_id)
+
+    def add_survey(self, survey: Survey) -> None:
+        """Append *survey*, keeping the id index current."""
+        index = self._surveys_by_id()
+        self.surveys.append(survey)
+        index.setdefault(survey.id, survey)
+        self._survey_index_of = (self.surveys, len(self.surveys))
+
+    def remove_survey(self, survey_id: str) -> None:
+        """Remove every survey with *survey_id* in place, keeping the index current."""
+        index = self._surveys_by_id()
+        if index.pop(survey_id, None) is None:
+            return
+        surveys = self.surveys
+        for i in range(len(surveys) - 1, -1, -1):
+            if surveys[i].id == survey_id:
+                del surveys[i]
+        self._survey_index_of = (surveys, len(surveys))
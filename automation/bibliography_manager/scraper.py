@@ -6,8 +6,8 @@ Three-phase extraction:
   Phase 2 — "muscle":    Visit each reference's link (Crossref,
             Google Scholar, or IEEE "View Article") to resolve
             the actual DOI.
-  Phase 3 — "enrich":    Call Crossref API for each DOI to get
-            clean title, authors, year, venue, abstract, and
+  Phase 3 — "enrich":    Call Crossref API (batched DOI filter) to
+            get clean title, authors, year, venue, abstract, and
             PDF URL.  Download PDFs when available.
 
 Also provides a Semantic Scholar API path that skips the browser
@@ -17,8 +17,10 @@ entirely when possible.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import html as html_mod
 import re
+import time
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -28,6 +30,7 @@ from urllib.parse import urlparse
 import httpx
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
+from . import cache
 from .models import Article
 
 # ── Constants ────────────────────────────────────────────────
@@ -35,6 +38,23 @@ from .models import Article
 DOI_REGEX = re.compile(r"10\.\d{4,9}/[^\s<>\"{}|\\^`]+", re.IGNORECASE)
 _FRAC_RE = re.compile(r"(\d+)/(\d+)")
 _UNSAFE_PATH_CHARS = re.compile(r"[\\/:*?\"<>|\s]+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_FILENAME_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9._-]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+_NON_WORD_RUN_RE = re.compile(r"[^\w]+")
+_QUOTED_TITLE_RE = re.compile(r'["\u201c](.+?)["\u201d]')
+_REF_NUMBER_PREFIX_RE = re.compile(r"^\[?\d+\]?\s*\.?\s*")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_DOI_LABEL_RE = re.compile(r"DOI:\s*(\S+)", re.IGNORECASE)
+_AUTHOR_SPLIT_RE = re.compile(r",\s*|\s+and\s+")
+_NOT_AN_AUTHOR_RE = re.compile(r"^(pp?\.|vol\.|no\.|in\s|proc|ieee|acm)", re.I)
+_PAGE_RANGE_RE = re.compile(r"^\d+[\-\u2013]\d+$")
+_HTML_TITLE_RE = re.compile(r"<title>\s*(.*?)\s*</title>", re.IGNORECASE | re.DOTALL)
+_IEEE_TITLE_SUFFIX_RE = re.compile(r"\s*\|\s*IEEE\b")
+_META_DOI_RE = re.compile(r'"doi"\s*:\s*"(10\.\d{4,}/[^"]+)"')
+_DOI_ORG_LINK_RE = re.compile(
+    r'<a[^>]*href="https?://doi\.org/(10\.\d{4,}/[^"]+)"', re.IGNORECASE,
+)
 
 # IEEE robots.txt specifies Crawl-delay: 10.  We fully honour it.
 _IEEE_CRAWL_DELAY: float = 10.0
@@ -133,6 +153,49 @@ class _RefSkeleton:
 # ── Utilities ────────────────────────────────────────────────
 
 
+class _CrawlDelay:
+    """Space successive requests at least *interval* seconds apart.
+
+    Measured start-to-start, so time spent waiting on the response
+    counts towards the delay instead of being added on top of it.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + self._interval  # reserve the slot before sleeping
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+# Shared by every fetch_ieee_meta call in the process.
+_ieee_crawl_delay = _CrawlDelay(_IEEE_CRAWL_DELAY)
+
+# IEEE cache key → (monotonic time, error message) of the last failed
+# fetch.  In-process only: a page that was rate-limited or missing is not
+# re-requested (nor does it take a crawl-delay slot) for a few minutes.
+_IEEE_FAILURE_TTL: float = 300.0
+_ieee_failures: dict[str, tuple[float, str]] = {}
+
+
+def _ieee_cache_key(url: str) -> str:
+    """Cache key for an IEEE page: the document number when there is one.
+
+    ``/document/123``, ``/document/123/`` and ``/document/123/references#…``
+    all share one entry, so re-imports of the same survey under another
+    URL shape skip the request (and its crawl delay).
+    """
+    path = url.partition("#")[0].partition("?")[0]
+    doc_id = path.rpartition("/document/")[2].partition("/")[0] if "/document/" in path else ""
+    if doc_id.isdecimal():
+        return f"ieee_meta:doc:{doc_id}"
+    return f"ieee_meta:{url}"
+
+
 def _clean_doi(raw: str) -> str:
     """Strip trailing punctuation that leaks into DOI matches."""
     return raw.rstrip(".,;)]\u201d\u201c\"'")
@@ -140,7 +203,7 @@ def _clean_doi(raw: str) -> str:
 
 def _strip_html_tags(text: str) -> str:
     """Remove JATS / HTML tags from Crossref abstracts."""
-    clean = re.sub(r"<[^>]+>", "", text)
+    clean = _HTML_TAG_RE.sub("", text)
     return html_mod.unescape(clean).strip()
 
 
@@ -155,9 +218,9 @@ def _safe_filename(doi: str) -> str:
     # 1. Remove directory traversal sequences first
     sanitized = doi.replace("..", "").replace("./", "").replace(".\\", "")
     # 2. Whitelist: keep only safe characters
-    sanitized = re.sub(r"[^a-zA-Z0-9._-]", "_", sanitized)
+    sanitized = _FILENAME_UNSAFE_RE.sub("_", sanitized)
     # 3. Collapse runs of underscores
-    sanitized = re.sub(r"_+", "_", sanitized).strip("_")
+    sanitized = _UNDERSCORE_RUN_RE.sub("_", sanitized).strip("_")
     # 4. Fallback for empty result
     if not sanitized:
         sanitized = "unknown_doi"
@@ -284,7 +347,7 @@ async def _save_debug_html(page: Page, url: str, progress: ProgressCB) -> None:
     try:
         _DEBUG_DIR.mkdir(parents=True, exist_ok=True)
         page_html = await page.content()
-        slug = re.sub(r"[^\w]+", "_", url.split("//")[-1])[:80]
+        slug = _NON_WORD_RUN_RE.sub("_", url.split("//")[-1])[:80]
         out = _DEBUG_DIR / f"{slug}.html"
         out.write_text(page_html, encoding="utf-8")
         if progress:
@@ -297,7 +360,7 @@ async def _save_debug_html(page: Page, url: str, progress: ProgressCB) -> None:
 async def _extract_title_from_ref(el: Any, text: str) -> str:
     """Extract the paper title from a reference element."""
     # Prefer quoted text (IEEE format: Author(s), "Title," venue, year.)
-    m = re.search(r'["\u201c](.+?)["\u201d]', text)
+    m = _QUOTED_TITLE_RE.search(text)
     if m:
         return m.group(1).strip().rstrip(",.")
 
@@ -319,7 +382,7 @@ def _extract_authors_text(text: str, title: str) -> str:
     if not title or title not in text:
         return ""
     before = text[: text.index(title)].strip().rstrip(",")
-    return re.sub(r"^\[?\d+\]?\s*\.?\s*", "", before)
+    return _REF_NUMBER_PREFIX_RE.sub("", before)
 
 
 async def _classify_links(el: Any) -> dict[str, str]:
@@ -369,7 +432,7 @@ async def _parse_single_ref(idx: int, el: Any) -> _RefSkeleton:
     title = await _extract_title_from_ref(el, text)
     authors = _extract_authors_text(text, title)
 
-    year_m = re.search(r"\b(19|20)\d{2}\b", text)
+    year_m = _YEAR_RE.search(text)
     links = await _classify_links(el)
 
     sk = _RefSkeleton(
@@ -470,7 +533,7 @@ async def _resolve_doi_from_ieee_page(page: Page, url: str) -> str | None:
         full = url if url.startswith("http") else f"https://ieeexplore.ieee.org{url}"
         await page.goto(full, wait_until="networkidle", timeout=30_000)
         body = await page.inner_text("body")
-        m = re.search(r"DOI:\s*(\S+)", body, re.IGNORECASE)
+        m = _DOI_LABEL_RE.search(body)
         if m:
             doi = _extract_doi_from_text(m.group(1))
             if doi:
@@ -558,13 +621,13 @@ async def _resolve_skeletons(
 
 def _parse_authors(raw_text: str) -> list[str]:
     """Parse author names from rough reference text."""
-    raw = re.sub(r"^\[?\d+\]?\s*\.?\s*", "", raw_text)
-    parts = re.split(r",\s*|\s+and\s+", raw)
+    raw = _REF_NUMBER_PREFIX_RE.sub("", raw_text)
+    parts = _AUTHOR_SPLIT_RE.split(raw)
     authors = [p.strip() for p in parts if p.strip() and len(p.strip()) > 1]
     return [
         a for a in authors
-        if not re.match(r"^(pp?\.|vol\.|no\.|in\s|proc|ieee|acm)", a, re.I)
-        and not re.match(r"^\d+[\-\u2013]\d+$", a)
+        if not _NOT_AN_AUTHOR_RE.match(a)
+        and not _PAGE_RANGE_RE.match(a)
     ]
 
 
@@ -663,18 +726,109 @@ def _apply_pdf_url(art: Article, msg: dict[str, Any]) -> bool:
     return False
 
 
+def _crossref_cache_key(doi: str) -> str:
+    return f"crossref:{doi.lower()}"
+
+
+# DOIs per Crossref /works?filter=doi:…,doi:… request.  The API allows
+# up to 1000 rows, but long filters risk URL-length limits on proxies.
+_CROSSREF_BATCH = 50
+
+# Registration agency per DOI prefix.  Crossref has nothing for DOIs
+# registered elsewhere, so asking it only costs a 404 (plus the politeness
+# delay).  Seeded with common non-Crossref prefixes; other prefixes are
+# learned from Crossref's /agency endpoint and persisted in the cache.
+_DOI_AGENCIES: dict[str, str] = {
+    "10.5281": "datacite",   # Zenodo
+    "10.6084": "datacite",   # figshare
+    "10.48550": "datacite",  # arXiv
+    "10.5061": "datacite",   # Dryad
+    "10.17605": "datacite",  # OSF
+    "10.7910": "datacite",   # Harvard Dataverse
+}
+
+
+def _doi_prefix(doi: str) -> str:
+    return doi.partition("/")[0].lower()
+
+
+def _doi_agency(doi: str) -> str | None:
+    """Known registration agency for *doi*'s prefix, or None if not yet seen.
+
+    In-memory only: ``_enrich_from_crossref`` pulls the cached agencies
+    for its prefixes into ``_DOI_AGENCIES`` before it starts.
+    """
+    return _DOI_AGENCIES.get(_doi_prefix(doi))
+
+
+async def _learn_doi_agency(client: httpx.AsyncClient, doi: str) -> None:
+    """After a Crossref 404, ask Crossref which agency registered *doi*."""
+    try:
+        resp = await client.get(f"https://api.crossref.org/works/{doi}/agency")
+        if resp.status_code != 200:
+            return  # malformed / unregistered DOI — says nothing about the prefix
+        agency = resp.json()["message"]["agency"]["id"]
+    except Exception:
+        return
+    prefix = _doi_prefix(doi)
+    _DOI_AGENCIES[prefix] = agency
+    await asyncio.to_thread(cache.put, f"doi_agency:{prefix}", agency)
+
+
 async def _enrich_one_article(client: httpx.AsyncClient, art: Article) -> int:
     """Query Crossref for one article.  Returns 1 if enriched, else 0."""
     try:
         resp = await client.get(f"https://api.crossref.org/works/{art.doi}")
+        if resp.status_code == 404:
+            await asyncio.sleep(0.3)  # politeness delay, as between works requests
+            await _learn_doi_agency(client, art.doi)
         if resp.status_code != 200:
             return 0
         msg = resp.json().get("message", {})
+        await asyncio.to_thread(cache.put, _crossref_cache_key(art.doi), msg)
         return 1 if _enrich_article_from_msg(art, msg) else 0
     except Exception:
         return 0
 
 
+async def _enrich_batch(client: httpx.AsyncClient, batch: list[Article]) -> int | None:
+    """Query Crossref for a batch of articles in one request.
+
+    Returns the count enriched, or None if the request itself failed
+    (non-200, e.g. a 400 from one odd DOI in the filter, a 429, or a
+    timeout) — the caller then retries the batch one DOI at a time.
+    """
+    try:
+        resp = await client.get(
+            "https://api.crossref.org/works",
+            params={
+                "filter": ",".join(f"doi:{art.doi}" for art in batch),
+                "rows": len(batch),
+            },
+        )
+        if resp.status_code != 200:
+            return None
+        items = resp.json().get("message", {}).get("items", [])
+    except Exception:
+        return None
+    by_doi = {item.get("DOI", "").lower(): item for item in items}
+    enriched = 0
+    records: list[tuple[str, dict]] = []
+    for art in batch:
+        msg = by_doi.get(art.doi.lower())
+        if msg is None:
+            # Not a Crossref record — find out who registered the prefix.
+            if _doi_agency(art.doi) is None:
+                await asyncio.sleep(0.3)  # politeness delay, as between works requests
+                await _learn_doi_agency(client, art.doi)
+            continue
+        records.append((_crossref_cache_key(art.doi), msg))
+        enriched += 1 if _enrich_article_from_msg(art, msg) else 0
+    # One transaction for the whole batch, off the event loop.
+    await asyncio.to_thread(cache.put_many, records)
+    return enriched
+
+
 async def _enrich_from_crossref(
     articles: list[Article],
     progress: ProgressCB = None,
@@ -691,16 +845,62 @@ async def _enrich_from_crossref(
             f"Phase 3: enriching metadata from Crossref for {len(enrichable)} articles\u2026"
         )
 
-    enriched = 0
+    # Every cached Crossref record and learned DOI agency in one threaded
+    # query, rather than a blocking SQLite lookup per article on the loop.
+    prefixes = {_doi_prefix(a.doi) for a in enrichable} - _DOI_AGENCIES.keys()
+    hits = await asyncio.to_thread(cache.get_many, [
+        *(_crossref_cache_key(a.doi) for a in enrichable),
+        *(f"doi_agency:{p}" for p in prefixes),
+    ])
+    for prefix in prefixes:
+        agency = hits.get(f"doi_agency:{prefix}")
+        if agency is not None:
+            _DOI_AGENCIES[prefix] = agency
+
+    enriched = done = 0
+    batched: list[Article] = []
+    single: list[Article] = []
+    for art in enrichable:
+        cached = hits.get(_crossref_cache_key(art.doi))
+        if cached is not None:
+            enriched += 1 if _enrich_article_from_msg(art, cached) else 0
+        elif _doi_agency(art.doi) not in (None, "crossref"):
+            pass  # registered elsewhere (DataCite, mEDRA, …): Crossref has no record
+        elif "," in art.doi:
+            single.append(art)  # a comma would split the batch filter
+            continue
+        else:
+            batched.append(art)
+            continue
+        done += 1
+    if progress and done:
+        await progress(f"  Crossref: {done}/{len(enrichable)} queried")
+
     async with httpx.AsyncClient(
         timeout=20,
         headers={"User-Agent": _USER_AGENT},
     ) as client:
-        for i, art in enumerate(enrichable, start=1):
+        # Live requests: up to _CROSSREF_BATCH DOIs per /works?filter= call,
+        # each followed by the politeness delay.
+        for start in range(0, len(batched), _CROSSREF_BATCH):
+            batch = batched[start:start + _CROSSREF_BATCH]
+            result = await _enrich_batch(client, batch)
+            await asyncio.sleep(0.3)
+            if result is None:
+                # Don't lose the whole batch to one bad DOI or a transient
+                # error: query its articles individually below.
+                single.extend(batch)
+                continue
+            enriched += result
+            done += len(batch)
+            if progress:
+                await progress(f"  Crossref: {done}/{len(enrichable)} queried")
+        for art in single:
             enriched += await _enrich_one_article(client, art)
-            if progress and i % 5 == 0:
-                await progress(f"  Crossref: {i}/{len(enrichable)} queried")
+            done += 1
             await asyncio.sleep(0.3)
+            if progress:
+                await progress(f"  Crossref: {done}/{len(enrichable)} queried")
 
     if progress:
         await progress(
@@ -827,21 +1027,48 @@ async def fetch_ieee_title(url: str) -> str:
     return info.get("title", "")
 
 
-async def fetch_ieee_meta(url: str) -> dict[str, str]:
+async def fetch_ieee_meta(
+    url: str, client: httpx.AsyncClient | None = None,
+) -> dict[str, str]:
     """Fetch title and DOI from an IEEE document page.
 
     Returns dict with keys ``title`` and ``doi`` (either may be empty).
-    Raises RuntimeError on HTTP errors (rate limit, not found, timeout, etc.).
+    Live requests are spaced by IEEE's robots.txt crawl delay.  Pass a
+    long-lived *client* to reuse its connections across many calls.
+    Raises RuntimeError on HTTP errors (rate limit, not found, timeout, etc.);
+    a failed page is not retried for ``_IEEE_FAILURE_TTL`` seconds.
     """
     _validate_source_url(url)
+    cache_key = _ieee_cache_key(url)
+    cached = await asyncio.to_thread(cache.get, cache_key)
+    if cached is not None:
+        return cached
+    failed = _ieee_failures.get(cache_key)
+    if failed is not None and time.monotonic() - failed[0] < _IEEE_FAILURE_TTL:
+        raise RuntimeError(failed[1])
+    await _ieee_crawl_delay.wait()  # cache hits above never wait
+    try:
+        result = await _fetch_ieee_page(url, client)
+    except RuntimeError as exc:
+        _ieee_failures[cache_key] = (time.monotonic(), str(exc))
+        raise
+    _ieee_failures.pop(cache_key, None)
+    if result["title"]:
+        await asyncio.to_thread(cache.put, cache_key, result)
+    return result
+
+
+async def _fetch_ieee_page(
+    url: str, client: httpx.AsyncClient | None,
+) -> dict[str, str]:
+    """One live request for ``fetch_ieee_meta``; every failure is a RuntimeError."""
     result: dict[str, str] = {"title": "", "doi": ""}
     try:
-        async with httpx.AsyncClient(
-            timeout=30,
-            follow_redirects=True,
-            headers={"User-Agent": _USER_AGENT},
-        ) as client:
-            resp = await client.get(url)
+        async with (
+            contextlib.nullcontext(client) if client is not None
+            else httpx.AsyncClient(follow_redirects=True, headers={"User-Agent": _USER_AGENT})
+        ) as http:
+            resp = await http.get(url, timeout=30)
             if resp.status_code != 200:
                 # Specific error messages for common status codes
                 if resp.status_code == 429:
@@ -854,23 +1081,13 @@ async def fetch_ieee_meta(url: str) -> dict[str, str]:
                     raise RuntimeError(f"HTTP {resp.status_code}")
             text = resp.text
             # ── title ──
-            m = re.search(
-                r"<title>\s*(.*?)\s*</title>", text,
-                re.IGNORECASE | re.DOTALL,
-            )
+            m = _HTML_TITLE_RE.search(text)
             if m:
                 raw = html_mod.unescape(m.group(1))
-                raw = re.split(r"\s*\|\s*IEEE\b", raw, maxsplit=1)[0]
+                raw = _IEEE_TITLE_SUFFIX_RE.split(raw, maxsplit=1)[0]
                 result["title"] = raw.strip()
             # ── DOI ──
-            doi_m = re.search(
-                r'"doi"\s*:\s*"(10\.\d{4,}/[^"]+)"', text,
-            )
-            if not doi_m:
-                doi_m = re.search(
-                    r'<a[^>]*href="https?://doi\.org/(10\.\d{4,}/[^"]+)"',
-                    text, re.IGNORECASE,
-                )
+            doi_m = _META_DOI_RE.search(text) or _DOI_ORG_LINK_RE.search(text)
             if doi_m:
                 result["doi"] = doi_m.group(1)
     except asyncio.TimeoutError:
@@ -6,11 +6,13 @@ so a crash mid-write never corrupts the real file.
 
 from __future__ import annotations
 
-import json
 import os
 import tempfile
+import threading
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from .models import Bibliography
 
 DEFAULT_PATH = Path("bibliography") / "data.json"
@@ -19,6 +21,15 @@ DEFAULT_PATH = Path("bibliography") / "data.json"
 # If you hit this, consider migrating to SQLite.
 _MAX_JSON_BYTES = 100 * 1024 * 1024
 
+# Serialises straight to UTF-8 bytes (model_dump_json returns str, which
+# would then be copied again by .encode()).
+_BIB_ADAPTER = TypeAdapter(Bibliography)
+
+# Saves run both on the UI thread and in asyncio.to_thread workers; one
+# writer at a time keeps an older snapshot from being renamed over a
+# newer one that started serialising later.
+_SAVE_LOCK = threading.Lock()
+
 
 def resolve_path(path: str | Path | None = None) -> Path:
     """Return an absolute Path, falling back to DEFAULT_PATH."""
@@ -29,10 +40,11 @@ def resolve_path(path: str | Path | None = None) -> Path:
 def load(path: str | Path | None = None) -> Bibliography:
     """Read and validate the JSON file.  Returns empty Bibliography if missing."""
     p = resolve_path(path)
-    if not p.exists():
+    try:
+        size = p.stat().st_size
+    except FileNotFoundError:
         return Bibliography()
 
-    size = p.stat().st_size
     if size > _MAX_JSON_BYTES:
         raise RuntimeError(
             f"Bibliography file is {size / 1024 / 1024:.1f} MB, "
@@ -40,8 +52,8 @@ def load(path: str | Path | None = None) -> Bibliography:
             "Consider migrating to SQLite."
         )
 
-    raw = p.read_text(encoding="utf-8")
-    return Bibliography.model_validate_json(raw)
+    # pydantic-core parses the UTF-8 bytes directly; no str decode needed.
+    return Bibliography.model_validate_json(p.read_bytes())
 
 
 def save(bib: Bibliography, path: str | Path | None = None) -> Path:
@@ -49,19 +61,20 @@ def save(bib: Bibliography, path: str | Path | None = None) -> Path:
     p = resolve_path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
 
-    data = bib.model_dump_json(indent=2, exclude_none=True)
-
-    # Write to temp file in the same directory, then replace atomically.
-    fd, tmp = tempfile.mkstemp(dir=p.parent, suffix=".tmp", prefix=".bib_")
-    try:
-        os.write(fd, (data + "\n").encode("utf-8"))
-        os.close(fd)
-        # os.replace() is atomic on the same filesystem and handles
-        # Windows (overwrites existing) — no gap between unlink/rename.
-        os.replace(tmp, p)
-    except BaseException:
-        os.close(fd) if not os.get_inheritable(fd) else None  # noqa: E501
-        Path(tmp).unlink(missing_ok=True)
-        raise
+    with _SAVE_LOCK:
+        data = _BIB_ADAPTER.dump_json(bib, indent=2, exclude_none=True)
+
+        # Write to temp file in the same directory, then replace atomically.
+        fd, tmp = tempfile.mkstemp(dir=p.parent, suffix=".tmp", prefix=".bib_")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+                fh.write(b"\n")
+            # os.replace() is atomic on the same filesystem and handles
+            # Windows (overwrites existing) — no gap between unlink/rename.
+            os.replace(tmp, p)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
 
     return p
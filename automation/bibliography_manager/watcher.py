@@ -0,0 +1,78 @@
+"""Edge-triggered change notification for the bibliography JSON file.
+
+Wraps a watchdog ``Observer`` on the file's parent directory so the TUI
+learns about edits (its own atomic saves, or the user editing the JSON
+in another program) without calling ``stat()`` on every refresh.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+
+_CHANGE_EVENTS = frozenset({"created", "modified", "moved", "deleted"})
+
+
+def _norm(path: str | bytes | Path) -> str:
+    return os.path.normcase(os.path.abspath(os.fsdecode(path)))
+
+
+class BibFileWatcher:
+    """Call *on_change* (from a background thread) whenever *path* changes.
+
+    ``storage.save`` writes a temp file and ``os.replace``s it into place,
+    so the interesting events are "moved onto *path*" as well as plain
+    created / modified events for *path* itself.
+    """
+
+    def __init__(self, path: Path, on_change: Callable[[], None]) -> None:
+        self._target = _norm(path)
+        self._dir = path.parent
+        self._on_change = on_change
+        self._observer: Any = None
+
+    @classmethod
+    def start(cls, path: Path, on_change: Callable[[], None]) -> BibFileWatcher | None:
+        """Start watching, or return None if watchdog can't watch *path*.
+
+        Callers fall back to ``stat()`` polling when this returns None
+        (watchdog missing, parent directory absent, inotify limits hit…).
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return None
+
+        watcher = cls(path, on_change)
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                watcher._dispatch(event)
+
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_Handler(), str(watcher._dir), recursive=False)
+            observer.start()
+        except (OSError, RuntimeError):
+            return None
+        watcher._observer = observer
+        return watcher
+
+    def _dispatch(self, event: Any) -> None:
+        # Ignore opened / closed events — our own storage.load() would
+        # otherwise re-trigger a reload forever.
+        if event.is_directory or event.event_type not in _CHANGE_EVENTS:
+            return
+        paths = [event.src_path, getattr(event, "dest_path", "") or ""]
+        if any(p and _norm(p) == self._target for p in paths):
+            self._on_change()
+
+    def stop(self) -> None:
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=1.0)